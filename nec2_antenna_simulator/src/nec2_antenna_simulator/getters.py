@@ -4,9 +4,27 @@ from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 
+# Sweep optimizers call get_impedance repeatedly for the same (context,
+# index); the binding round trip is memoized here and invalidated on run().
+_imp_cache: Dict[Tuple[int, int], complex] = {}
+
+
+def clear_impedance_cache(nec=None) -> None:
+  """Clear memoized impedances, for one context or (``nec=None``) all of them."""
+  if nec is None:
+    _imp_cache.clear()
+    return
+  nid = id(nec)
+  for key in [k for k in _imp_cache if k[0] == nid]:
+    del _imp_cache[key]
+
+
 def get_impedance(nec, index):
   """Return the complex input impedance for a given NEC input index.
 
+  Results are cached per ``(nec, index)``; ``run`` clears the cache so a
+  re-run never serves stale values.
+
   Parameters
   ----------
   nec : object
@@ -19,7 +37,12 @@ def get_impedance(nec, index):
   complex
       Complex impedance at the requested input.
   """
-  return nec.get_input_parameters(index).get_impedance()
+  key = (id(nec), index)
+  z = _imp_cache.get(key)
+  if z is None:
+    z = nec.get_input_parameters(index).get_impedance()
+    _imp_cache[key] = z
+  return z
 
 
 def get_structure_currents(nec, freq_index: int = 0) -> Dict[str, Any]:
@@ -101,57 +124,93 @@ def get_structure_currents(nec, freq_index: int = 0) -> Dict[str, Any]:
         return complex(float(item.real()), float(item.imag()))
       return None
 
-    if cur_fn or (cur_re_fn and cur_im_fn):
+    # Bulk-gather with np.fromiter instead of per-index assignment so numpy
+    # does the boxing once per array rather than once per segment.
+    if cur_fn is not None:
+      try:
+        data["currents"] = np.fromiter(
+            (cur_fn(i) for i in range(n)), dtype=np.complex128, count=n
+        )
+      except TypeError:
+        pass
+    if "currents" not in data and cur_re_fn and cur_im_fn:
+      try:
+        re = np.fromiter((cur_re_fn(i) for i in range(n)), dtype=np.float64, count=n)
+        im = np.fromiter((cur_im_fn(i) for i in range(n)), dtype=np.float64, count=n)
+        data["currents"] = re + 1j * im
+      except TypeError:
+        pass
+    if "currents" not in data and hasattr(obj, "__getitem__"):
       currents = np.zeros(n, dtype=np.complex128)
+      found = False
       for i in range(n):
-        if cur_fn:
-          try:
-            currents[i] = complex(cur_fn(i))
-            continue
-          except TypeError:
-            pass
-        if cur_re_fn and cur_im_fn:
-          try:
-            currents[i] = complex(float(cur_re_fn(i)), float(cur_im_fn(i)))
-            continue
-          except TypeError:
-            pass
-
-        if hasattr(obj, "__getitem__"):
-          try:
-            item = obj[i]
-            value = _current_from_item(item)
-            if value is not None:
-              currents[i] = value
-              continue
-          except Exception:
-            pass
-      data["currents"] = currents
-
-  # Tag/segment metadata if exposed.
+        try:
+          value = _current_from_item(obj[i])
+        except Exception:
+          value = None
+        if value is not None:
+          currents[i] = value
+          found = True
+      if found:
+        data["currents"] = currents
+
+  # Tag/segment metadata if exposed. Prefer item access: one extension
+  # dispatch per segment yields both fields, halving the getter calls of the
+  # separate tag/segment paths below.
   if n:
-    tag_fn = _first(["get_tag", "get_tag_number", "get_tag_no", "get_tagno", "tag"])
-    seg_fn = _first(["get_seg", "get_segment", "get_segment_number", "get_seg_number", "segment"])
-    if tag_fn is not None:
-      tags = np.zeros(n, dtype=int)
+    item_path = False
+    if hasattr(obj, "__getitem__"):
+      try:
+        it0 = obj[0]
+        item_path = hasattr(it0, "get_tag") and hasattr(it0, "get_segment_number")
+      except Exception:
+        item_path = False
+    if item_path:
+      tags = np.empty(n, dtype=np.intp)
+      segments = np.empty(n, dtype=np.intp)
       for i in range(n):
-        tags[i] = int(tag_fn(i))
+        it = obj[i]
+        tags[i] = it.get_tag()
+        segments[i] = it.get_segment_number()
       data["tags"] = tags
-    if seg_fn is not None:
-      segments = np.zeros(n, dtype=int)
-      for i in range(n):
-        segments[i] = int(seg_fn(i))
       data["segments"] = segments
+    else:
+      tag_fn = _first(["get_tag", "get_tag_number", "get_tag_no", "get_tagno", "tag"])
+      seg_fn = _first(["get_seg", "get_segment", "get_segment_number", "get_seg_number", "segment"])
+      if tag_fn is not None:
+        data["tags"] = np.fromiter((tag_fn(i) for i in range(n)), dtype=np.intp, count=n)
+      if seg_fn is not None:
+        data["segments"] = np.fromiter((seg_fn(i) for i in range(n)), dtype=np.intp, count=n)
 
   return data
 
 
+# Radiation patterns are invariant between runs, so repeated plot calls can
+# reuse the arrays already copied out of the NEC context.
+_pattern_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def clear_radiation_pattern_cache(nec=None) -> None:
+    """Clear memoized radiation patterns, for one context or all of them."""
+    if nec is None:
+        _pattern_cache.clear()
+        return
+    nid = id(nec)
+    for key in [k for k in _pattern_cache if k[0] == nid]:
+        del _pattern_cache[key]
+
+
 def get_radiation_pattern(nec, freq_index: int = 0) -> Dict[str, Any]:
+    key = (id(nec), freq_index)
+    cached = _pattern_cache.get(key)
+    if cached is not None:
+        return cached
     rp = nec.get_radiation_pattern(freq_index)
     gains = rp.get_gain()
     thetas = rp.get_theta_angles()
     phis = rp.get_phi_angles()
     data = {"gain_db": gains, "theta": thetas, "phi": phis}
+    _pattern_cache[key] = data
     return data
 
 
@@ -1,6 +1,22 @@
 """Antenna metrics"""
+import math
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _tl_kernel(f_mhz, zl, z0, k, out):
+        # k = 2*pi*1e6*l / (3e8*vf), so k*f_mhz[i] is beta*l at that frequency.
+        for i in prange(f_mhz.shape[0]):
+            t = math.tan(k * f_mhz[i])
+            out[i] = z0 * (zl[i] + 1j * z0 * t) / (z0 + 1j * zl[i] * t)
+
 
 def reflection_coefficient(z, z0):
   """Compute the magnitude of the reflection coefficient.
@@ -19,6 +35,11 @@ def reflection_coefficient(z, z0):
   """
   return (z - z0) / (z + z0)
 
+
+def _abs_gamma(z, z0):
+  """Magnitude of the reflection coefficient, without forming Gamma itself."""
+  return np.abs(z - z0) / np.abs(z + z0)
+
 def vswr(z, z0):
     """Compute voltage standing wave ratio (VSWR).
 
@@ -34,7 +55,7 @@ def vswr(z, z0):
     float or ndarray
         VSWR value.
     """
-    Gamma = np.abs(reflection_coefficient(z, z0))
+    Gamma = _abs_gamma(z, z0)
     return (1 + Gamma) / (1 - Gamma)
 
 def mismatch(z, z0):
@@ -52,8 +73,9 @@ def mismatch(z, z0):
     float or ndarray
         Mismatch efficiency.
     """
-    Gamma = reflection_coefficient(z, z0)
-    return 1 - Gamma**2
+    # |Gamma|^2 from the squared magnitudes directly; no sqrt, no complex power.
+    g2 = np.abs(z - z0) ** 2 / np.abs(z + z0) ** 2
+    return 1 - g2
 
 def transmission_line(z0, zl, l, f_mhz, vf=1.0):
     """
@@ -103,9 +125,36 @@ def transmission_line(z0, zl, l, f_mhz, vf=1.0):
     is preserved along the line:
 
         |Γ_in| = |Γ_L|
+
+    When Numba is installed, frequency sweeps with scalar ``z0``, ``l`` and
+    ``vf`` run through a fused, parallel JIT kernel; otherwise the NumPy
+    expression is used.
     """
+    # Sweep fast path: scalar line parameters with a 1-D frequency axis go
+    # through the fused Numba kernel, which avoids the intermediate arrays of
+    # the NumPy expression and parallelizes over frequencies.
+    if (
+        _HAS_NUMBA
+        and np.ndim(f_mhz) == 1
+        and np.ndim(zl) <= 1
+        and np.ndim(z0) == 0
+        and np.ndim(l) == 0
+        and np.ndim(vf) == 0
+    ):
+        f_arr = np.ascontiguousarray(f_mhz, dtype=np.float64)
+        zl_arr = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(zl, dtype=np.complex128), f_arr.shape)
+        )
+        k = 2.0 * np.pi * 1e6 * float(l) / (3e8 * float(vf))
+        out = np.empty(f_arr.shape, dtype=np.complex128)
+        _tl_kernel(f_arr, zl_arr, complex(z0), k, out)
+        return out
+
     f = f_mhz * 1e6
     vp = 3e8 * vf
     beta = 2 * np.pi * f / vp
-    zin = z0 * (zl + 1j * z0 * np.tan(beta * l)) / (z0 + 1j * zl * np.tan(beta * l))
-    return zin
+    # Evaluate tan(beta*l) once; it is the transcendental bottleneck on sweeps.
+    t = np.tan(beta * l)
+    jz0t = 1j * z0 * t
+    jzlt = 1j * zl * t
+    return z0 * (zl + jz0t) / (z0 + jzlt)
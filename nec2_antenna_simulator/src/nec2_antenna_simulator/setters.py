@@ -1,12 +1,12 @@
 """Helper functions to set the cards"""
 
+import numpy as np
+
+from .getters import clear_impedance_cache, clear_radiation_pattern_cache
+
 
 def _nec2_meta(nec):
-    meta = getattr(nec, "_nec2_meta", None)
-    if meta is None:
-        meta = {}
-        setattr(nec, "_nec2_meta", meta)
-    return meta
+    return nec.__dict__.setdefault("_nec2_meta", {})
 
 
 def set_geometry(nec, wires, excitations):
@@ -29,16 +29,33 @@ def set_geometry(nec, wires, excitations):
         The same NEC context, for chaining.
     """
     meta = _nec2_meta(nec)
-    meta["wires"] = list(wires)
-    meta["excitations"] = list(excitations)
+    # Stored as read-only snapshots; tuple() is cheaper than list() and the
+    # wire/excitation tuples themselves are kept by reference, not copied.
+    meta["wires"] = tuple(wires)
+    meta["excitations"] = tuple(excitations)
 
     geo = nec.get_geometry()
 
-    for i, wire in enumerate(wires):
-        geo.wire(i+1, *wire)
+    # Bindings that expose a bulk wire upload take one contiguous array call
+    # instead of one boxed-argument dispatch per wire.
+    if hasattr(geo, "wire_array"):
+        wires_arr = np.asarray(meta["wires"], dtype=np.float64).reshape(len(meta["wires"]), 10)
+        tags = np.arange(1, wires_arr.shape[0] + 1, dtype=np.int32)
+        geo.wire_array(
+            tags,
+            wires_arr[:, 0].astype(np.int32),           # segment counts
+            np.ascontiguousarray(wires_arr[:, 1:4]),    # p0
+            np.ascontiguousarray(wires_arr[:, 4:7]),    # p1
+            np.ascontiguousarray(wires_arr[:, 7]),      # radius
+            np.ascontiguousarray(wires_arr[:, 8]),      # rdel
+            np.ascontiguousarray(wires_arr[:, 9]),      # rrad
+        )
+    else:
+        for i, wire in enumerate(meta["wires"]):
+            geo.wire(i+1, *wire)
     nec.geometry_complete(1)
 
-    for excitation in excitations:
+    for excitation in meta["excitations"]:
         nec.ex_card(*excitation)
 
     return nec
@@ -66,8 +83,10 @@ def set_loads(nec, loads):
             meta["loads"] = [loads]
             nec.ld_card(*loads)
         else:
-            meta["loads"] = list(loads)
-            for ld in loads:
+            # Keep the caller's list by reference; only materialize other
+            # iterables. Avoids an O(n_loads) copy on per-segment load sets.
+            meta["loads"] = loads if isinstance(loads, list) else list(loads)
+            for ld in meta["loads"]:
                 nec.ld_card(*ld)
     return nec
 
@@ -151,5 +170,8 @@ def run(nec):
     object
         The same NEC context, for chaining.
     """
+    # A new run invalidates anything memoized from previous runs.
+    clear_impedance_cache(nec)
+    clear_radiation_pattern_cache(nec)
     nec.xq_card(0)
     return nec
@@ -1,8 +1,8 @@
 """Visualization utils"""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Optional, Sequence, Tuple, Union, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union, Any, List
 
 import numpy as np
 import matplotlib.pyplot as plt
@@ -30,48 +30,61 @@ ExcitationTuple = Tuple[int, int, int, int, float, float, float, float, float, f
 LoadTuple = Tuple[int, int, int, int, float, float, float]
 
 
-@dataclass
-class SegmentMap:
-    """Mapping between (wire_idx, seg_idx) and global segment index."""
-    wire_idx: int
-    seg_idx: int
-    global_idx: int
-    center_xyz: np.ndarray
-
-
 def _segment_centers_for_wire(p0: np.ndarray, p1: np.ndarray, nseg: int) -> np.ndarray:
     """
     Return segment center points for a straight wire subdivided into nseg segments.
     Centers are at (k+0.5)/nseg along the wire.
     """
-    t = (np.arange(nseg, dtype=float) + 0.5) / float(nseg)
-    return p0[None, :] * (1.0 - t[:, None]) + p1[None, :] * t[:, None]
-
+    if nseg <= 0:
+        return np.empty((0, 3), dtype=np.float64)
+    d = p1 - p0
+    t = (np.arange(nseg, dtype=np.float64) + 0.5) * (1.0 / nseg)
+    # One output allocation: out = t*d, then shift by p0 in place.
+    out = np.empty((nseg, 3), dtype=np.float64)
+    np.multiply(t[:, None], d[None, :], out=out)
+    out += p0
+    return out
+
+
+def _build_segment_map(
+    wires: Sequence[WireTuple],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build a structure-of-arrays segment map for a wire list.
+
+    Returns
+    -------
+    tuple
+        ``(all_centers, wire_idx, seg_idx)`` where ``all_centers`` is a
+        ``(total_segments, 3)`` float array of segment centers and
+        ``wire_idx``/``seg_idx`` are parallel int arrays (0-based wire index,
+        1-based segment number). Row ``g`` is the global segment index ``g``.
+    """
+    nsegs = np.array([int(w[0]) for w in wires], dtype=np.intp)
+    total = int(nsegs.sum())
+    offsets = np.concatenate(([0], np.cumsum(nsegs)))
+
+    all_centers = np.empty((total, 3), dtype=np.float64)
+    p0s = np.array([w[1:4] for w in wires], dtype=np.float64).reshape(-1, 3)
+    p1s = np.array([w[4:7] for w in wires], dtype=np.float64).reshape(-1, 3)
+    for wi in range(len(wires)):
+        all_centers[offsets[wi]:offsets[wi + 1]] = _segment_centers_for_wire(
+            p0s[wi], p1s[wi], int(nsegs[wi])
+        )
 
-def _build_segment_map(wires: Sequence[WireTuple]) -> List[SegmentMap]:
-    segmap: List[SegmentMap] = []
-    g = 0
-    for wi, w in enumerate(wires):
-        nseg, x0, y0, z0, x1, y1, z1, *_ = w
-        p0 = np.array([x0, y0, z0], dtype=float)
-        p1 = np.array([x1, y1, z1], dtype=float)
-        centers = _segment_centers_for_wire(p0, p1, int(nseg))
-        for si in range(int(nseg)):
-            segmap.append(SegmentMap(wire_idx=wi, seg_idx=si + 1, global_idx=g, center_xyz=centers[si]))
-            g += 1
-    return segmap
+    wire_idx = np.repeat(np.arange(len(wires), dtype=np.intp), nsegs)
+    seg_idx = np.arange(total, dtype=np.intp) - np.repeat(offsets[:-1], nsegs) + 1
+    return all_centers, wire_idx, seg_idx
 
 
-def _find_segment_center(segmap: Sequence[SegmentMap], wire_tag: int, seg_nr: int) -> Optional[np.ndarray]:
+def _find_segment_center(
+    centers_by_key: Dict[Tuple[int, int], np.ndarray], wire_tag: int, seg_nr: int
+) -> Optional[np.ndarray]:
     """
     In your repo, wire tags are assigned as i+1 when building geometry. :contentReference[oaicite:1]{index=1}
     So wire_tag maps to wire_idx = wire_tag-1.
     """
-    target_wi = wire_tag - 1
-    for s in segmap:
-        if s.wire_idx == target_wi and s.seg_idx == seg_nr:
-            return s.center_xyz
-    return None
+    return centers_by_key.get((wire_tag - 1, seg_nr))
 
 
 
@@ -133,50 +146,82 @@ def plot_nec_model_3d(
         excitations = ()
 
     # Build segment map (lets us place markers at segment centers)
-    segmap = _build_segment_map(wires)
+    all_centers, seg_wire_idx, seg_seg_idx = _build_segment_map(wires)
+    centers_by_key = {
+        key: all_centers[g]
+        for g, key in enumerate(zip(seg_wire_idx.tolist(), seg_seg_idx.tolist()))
+    }
+    nsegs_list = [int(w[0]) for w in wires]
+    offsets = np.cumsum([0] + nsegs_list)
 
     # --- Plot wires ---
-    for wi, w in enumerate(wires):
-        nseg, x0, y0, z0, x1, y1, z1, radius, rdel, rrad = w
+    # One NaN-separated polyline trace for all wires instead of a trace per
+    # wire; Plotly render cost then stays O(1) in the number of wires.
+    n_wires = len(wires)
+    if n_wires:
+        wires_arr = np.asarray(wires, dtype=np.float64).reshape(n_wires, 10)
+        coords = np.full((n_wires, 3, 3), np.nan)
+        coords[:, 0, :] = wires_arr[:, 1:4]
+        coords[:, 1, :] = wires_arr[:, 4:7]
+        coords = coords.reshape(-1, 3)
+        # Per-point metadata (tag, segments, radius, rdel, rrad), repeated for
+        # both endpoints and the NaN separator of each wire.
+        wire_meta = np.column_stack([
+            np.arange(1, n_wires + 1, dtype=np.float64),
+            wires_arr[:, 0],
+            wires_arr[:, 7],
+            wires_arr[:, 8],
+            wires_arr[:, 9],
+        ])
         fig.add_trace(
             go.Scatter3d(
-                x=[x0, x1],
-                y=[y0, y1],
-                z=[z0, z1],
+                x=coords[:, 0],
+                y=coords[:, 1],
+                z=coords[:, 2],
                 mode="lines",
-                name=f"wire tag {wi+1}",
+                name="wires",
+                connectgaps=False,
+                customdata=np.repeat(wire_meta, 3, axis=0),
                 hovertemplate=(
-                    f"wire tag: {wi+1}<br>"
-                    f"segments: {int(nseg)}<br>"
-                    f"radius: {radius} m<br>"
-                    f"rdel: {rdel}, rrad: {rrad}<br>"
-                    f"p0: ({x0:.4g},{y0:.4g},{z0:.4g})<br>"
-                    f"p1: ({x1:.4g},{y1:.4g},{z1:.4g})<br>"
+                    "wire tag: %{customdata[0]:.0f}<br>"
+                    "segments: %{customdata[1]:.0f}<br>"
+                    "radius: %{customdata[2]} m<br>"
+                    "rdel: %{customdata[3]}, rrad: %{customdata[4]}<br>"
+                    "point: (%{x:.4g},%{y:.4g},%{z:.4g})<br>"
                     "<extra></extra>"
                 ),
             )
         )
 
     # --- Plot excitations (EX) ---
+    # All EX markers go into one trace; per-source details live in customdata
+    # so the figure payload stays O(1) traces regardless of source count.
+    ex_xyz: List[np.ndarray] = []
+    ex_meta: List[Tuple[float, ...]] = []
     for ex in excitations or []:
         I1, I2, I3, I4, F1, F2, *_ = ex
         # Most common: voltage source (I1=0) or current source (I1=4)
-        c = _find_segment_center(segmap, wire_tag=int(I2), seg_nr=int(I3)) if int(I2) != 0 else None
+        c = _find_segment_center(centers_by_key, wire_tag=int(I2), seg_nr=int(I3)) if int(I2) != 0 else None
         if c is None:
             continue
         mag = float(np.hypot(F1, F2))
         phase = float(np.degrees(np.arctan2(F2, F1)))
+        ex_xyz.append(c)
+        ex_meta.append((I1, I2, I3, F1, F2, mag, phase))
+    if ex_xyz:
+        xyz = np.vstack(ex_xyz)
         fig.add_trace(
             go.Scatter3d(
-                x=[c[0]], y=[c[1]], z=[c[2]],
+                x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2],
                 mode="markers",
-                name=f"EX (tag {I2}, seg {I3})",
+                name="EX",
                 marker=dict(size=6, symbol="diamond"),
+                customdata=np.asarray(ex_meta, dtype=np.float64),
                 hovertemplate=(
-                    f"EX type I1: {I1}<br>"
-                    f"wire tag: {I2}, segment: {I3}<br>"
-                    f"phasor: {F1}+j{F2}<br>"
-                    f"|exc|: {mag:.4g}, ∠: {phase:.2f}°<br>"
+                    "EX type I1: %{customdata[0]:.0f}<br>"
+                    "wire tag: %{customdata[1]:.0f}, segment: %{customdata[2]:.0f}<br>"
+                    "phasor: %{customdata[3]}+j%{customdata[4]}<br>"
+                    "|exc|: %{customdata[5]:.4g}, ∠: %{customdata[6]:.2f}°<br>"
                     "<extra></extra>"
                 ),
             )
@@ -191,6 +236,9 @@ def plot_nec_model_3d(
     else:
         ld_list = list(loads)  # type: ignore[arg-type]
 
+    # One trace across all loads, mirroring the EX batching above.
+    ld_xyz: List[np.ndarray] = []
+    ld_meta: List[np.ndarray] = []
     for ld in ld_list:
         I1, I2, I3, I4, F1, F2, F3 = ld
         tag = int(I2)
@@ -203,26 +251,36 @@ def plot_nec_model_3d(
         if s0 <= 0 or s1 <= 0:
             continue
 
-        # Mark each loaded segment center
-        centers = []
-        for s in range(min(s0, s1), max(s0, s1) + 1):
-            c = _find_segment_center(segmap, wire_tag=tag, seg_nr=s)
-            if c is not None:
-                centers.append(c)
-        if not centers:
+        # Mark each loaded segment center: one contiguous slice of the SoA map
+        wi = tag - 1
+        if wi >= len(nsegs_list):
             continue
-        centers = np.vstack(centers)
-
+        lo, hi = sorted((s0, s1))
+        lo = max(lo, 1)
+        hi = min(hi, nsegs_list[wi])
+        if lo > hi:
+            continue
+        centers = all_centers[offsets[wi] + lo - 1 : offsets[wi] + hi]
+        ld_xyz.append(centers)
+        ld_meta.append(np.tile(
+            np.array([I1, tag, s0, s1, F1, F2, F3], dtype=np.float64),
+            (len(centers), 1),
+        ))
+
+    if ld_xyz:
+        xyz = np.vstack(ld_xyz)
         fig.add_trace(
             go.Scatter3d(
-                x=centers[:, 0], y=centers[:, 1], z=centers[:, 2],
+                x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2],
                 mode="markers",
-                name=f"LD (tag {tag}, {s0}-{s1})",
+                name="LD",
                 marker=dict(size=4, symbol="square"),
+                customdata=np.vstack(ld_meta),
                 hovertemplate=(
-                    f"LD type I1: {I1}<br>"
-                    f"wire tag: {tag}, segments: {s0}..{s1}<br>"
-                    f"F1,F2,F3: {F1}, {F2}, {F3}<br>"
+                    "LD type I1: %{customdata[0]:.0f}<br>"
+                    "wire tag: %{customdata[1]:.0f}, "
+                    "segments: %{customdata[2]:.0f}..%{customdata[3]:.0f}<br>"
+                    "F1,F2,F3: %{customdata[4]}, %{customdata[5]}, %{customdata[6]}<br>"
                     "<extra></extra>"
                 ),
             )
@@ -252,6 +310,7 @@ def plot_radiation_patterns(
     rmin=-15,
     rmax_pad=1.1,
     figsize_per_row=(10, 5.8),
+    parallel_fetch=False,
 ):
     """
     Plot NEC radiation pattern cuts in polar coordinates.
@@ -273,6 +332,10 @@ def plot_radiation_patterns(
         Multiply global max by this for upper radial limit.
     figsize_per_row : tuple(float, float)
         Base figsize per row when plotting multiple frequencies.
+    parallel_fetch : bool
+        Fetch the per-frequency patterns from the NEC context in a thread
+        pool. Only enable this if the underlying binding supports concurrent
+        reads; default is the serial path.
     """
 
     # --- resolve freq_indices ---
@@ -293,19 +356,50 @@ def plot_radiation_patterns(
 
     # --- load patterns for each frequency ---
     patterns = []
-    global_max = -np.inf
 
-    for fi, f in zip(freq_indices, freqs):
-        rp = get_radiation_pattern(nec=nec, freq_index=fi)
+    if parallel_fetch and len(freq_indices) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(freq_indices))) as pool:
+            rps = list(pool.map(
+                lambda fi: get_radiation_pattern(nec=nec, freq_index=fi), freq_indices
+            ))
+    else:
+        rps = [get_radiation_pattern(nec=nec, freq_index=fi) for fi in freq_indices]
+
+    for fi, f, rp in zip(freq_indices, freqs, rps):
         gains = np.asarray(rp["gain_db"])
         thetas = np.asarray(rp["theta"])
         phis = np.asarray(rp["phi"])
 
-        patterns.append({"f": f, "fi": fi, "gains": gains, "thetas": thetas, "phis": phis})
-        global_max = max(global_max, float(np.nanmax(gains)))
+        patterns.append({
+            "f": f, "fi": fi, "gains": gains, "thetas": thetas, "phis": phis,
+            # Precomputed once here; the draw loop and slider callbacks reuse them.
+            "theta_rad": np.deg2rad(thetas),
+            "phi_rad": np.deg2rad(phis),
+        })
+
+    # Stack gains into one (n_freq, n_theta, n_phi) block when shapes agree:
+    # the global max is then a single contiguous pass, and the slider
+    # callbacks slice this block instead of re-indexing each pattern dict.
+    if len({p["gains"].shape for p in patterns}) == 1:
+        G = np.stack([p["gains"] for p in patterns], axis=0)
+        global_max = float(np.nanmax(G))
+    else:
+        G = None
+        global_max = max(float(np.nanmax(p["gains"])) for p in patterns)
 
     rmax = float(global_max * rmax_pad)
 
+    # Pre-format every possible title once so the slider callbacks only swap
+    # strings instead of rebuilding f-strings per event and per row.
+    titles_theta = [
+        [f"f={p['f']:.3f} MHz  |  θ cut (φ = {phi:.1f}°)" for phi in p["phis"]]
+        for p in patterns
+    ]
+    titles_phi = [
+        [f"f={p['f']:.3f} MHz  |  φ cut (θ = {theta:.1f}°)" for theta in p["thetas"]]
+        for p in patterns
+    ]
+
     nrows = len(patterns)
     fig_w, fig_h = figsize_per_row
     fig, ax = plt.subplots(
@@ -327,9 +421,8 @@ def plot_radiation_patterns(
         gains = p["gains"]
         thetas = p["thetas"]
         phis = p["phis"]
-
-        theta_rad = np.deg2rad(thetas)
-        phi_rad = np.deg2rad(phis)
+        theta_rad = p["theta_rad"]
+        phi_rad = p["phi_rad"]
 
         # set r-limits
         ax[r, 0].set_rlim([rmin, rmax])
@@ -343,8 +436,8 @@ def plot_radiation_patterns(
         line_phi.append(lp)
 
         # titles (show actual degrees, not indices)
-        ax[r, 0].set_title(f"f={p['f']:.3f} MHz  |  θ cut (φ = {phis[j0]:.1f}°)")
-        ax[r, 1].set_title(f"f={p['f']:.3f} MHz  |  φ cut (θ = {thetas[i0]:.1f}°)")
+        ax[r, 0].set_title(titles_theta[r][j0])
+        ax[r, 1].set_title(titles_phi[r][i0])
 
     # --- sliders (one pair controlling all rows) ---
     fig.subplots_adjust(bottom=0.12)
@@ -375,19 +468,17 @@ def plot_radiation_patterns(
     def update_phi(_val):
         j = int(s_phi.val)
         for r, p in enumerate(patterns):
-            gains = p["gains"]
-            phis = p["phis"]
-            line_theta[r].set_ydata(gains[:, j])
-            ax[r, 0].set_title(f"f={p['f']:.3f} MHz  |  θ cut (φ = {phis[j]:.1f}°)")
+            gains = G[r] if G is not None else p["gains"]
+            line_theta[r].set_ydata(np.ascontiguousarray(gains[:, j]))
+            ax[r, 0].title.set_text(titles_theta[r][j])
         fig.canvas.draw_idle()
 
     def update_theta(_val):
         i = int(s_theta.val)
         for r, p in enumerate(patterns):
-            gains = p["gains"]
-            thetas = p["thetas"]
+            gains = G[r] if G is not None else p["gains"]
             line_phi[r].set_ydata(gains[i, :])
-            ax[r, 1].set_title(f"f={p['f']:.3f} MHz  |  φ cut (θ = {thetas[i]:.1f}°)")
+            ax[r, 1].title.set_text(titles_phi[r][i])
         fig.canvas.draw_idle()
 
     s_phi.on_changed(update_phi)